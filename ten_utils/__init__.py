@@ -7,7 +7,7 @@ from ._common import (
 )
 
 from .errors import *
-from .singleton import Singleton
+from .singleton import Singleton, Multiton
 from .log import Logger
 from .buffer import Buffer
 from .env_loader import EnvLoader
\ No newline at end of file
@@ -16,6 +16,9 @@ LOGGER_LEVELS = {
 }
 LOGGER_FORMAT = "{0} [{1}] {2}.{3}: {4}"
 
+# buffer
+BUFFER_DEFAULT_NAMESPACE = ""
+
 # rich
 CONSOLE_THEME = Theme({
     "debug": "white",
@@ -0,0 +1,11 @@
+from .cases import BenchmarkCase, iter_cases
+from .runner import run_benchmarks, compare_results, save_results, load_results
+
+__all__ = [
+    "BenchmarkCase",
+    "iter_cases",
+    "run_benchmarks",
+    "compare_results",
+    "save_results",
+    "load_results",
+]
@@ -0,0 +1,121 @@
+from pathlib import Path
+import argparse
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from .._common import CONSOLE_THEME
+from .cases import iter_cases
+from .runner import compare_results, load_results, run_benchmarks, save_results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m ten_utils.bench",
+        description="Run the ten-utils performance benchmarks and compare them against a baseline.",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=Path("bench-results.json"),
+        help="where to write the JSON results (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-b", "--baseline", type=Path,
+        help="JSON results to compare against; exits with status 1 on regression",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="merge the results into --baseline instead of comparing against it",
+    )
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=0.25,
+        help="allowed relative slowdown before failing (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k", "--filter", dest="pattern",
+        help="only run benchmarks whose name contains this substring",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="measurements per benchmark; the fastest is kept (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=4,
+        help="largest thread count for the Buffer benchmarks (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="run 10x fewer operations per benchmark, for smoke testing",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.update_baseline and args.baseline is None:
+        parser.error("--update-baseline requires --baseline")
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    if args.threads < 1:
+        parser.error("--threads must be at least 1")
+
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark command line interface.
+
+    Args:
+        argv (list[str] | None): Command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit status, 1 if a regression was found and 0 otherwise.
+    """
+    args = parse_args(argv)
+    console = Console(theme=CONSOLE_THEME)
+
+    results = run_benchmarks(
+        iter_cases(max_threads=args.threads),
+        pattern=args.pattern,
+        repeat=args.repeat,
+        scale=0.1 if args.quick else 1.0,
+    )
+    save_results(args.output, results)
+
+    baseline = {}
+    if args.update_baseline:
+        previous = load_results(args.baseline) if args.baseline.exists() else {}
+        save_results(args.baseline, {**previous, **results})
+
+    elif args.baseline is not None:
+        baseline = load_results(args.baseline)
+
+    regressions = compare_results(results, baseline, tolerance=args.tolerance)
+
+    table = Table("benchmark", "time/op", "ops/s", "vs baseline")
+    for name, seconds in results.items():
+        ratio = seconds / baseline[name] if baseline.get(name) else None
+        table.add_row(
+            name,
+            f"{seconds * 1e6:.3f} µs",
+            f"{1 / seconds:,.0f}" if seconds else "-",
+            "-" if ratio is None else f"[{'error' if name in regressions else 'info'}]{ratio:.2f}x",
+        )
+
+    console.print(table)
+    console.print(f"Results written to {str(args.output)!r}", style="info")
+
+    if regressions:
+        console.print(
+            f"{len(regressions)} benchmark(s) exceeded the {args.tolerance:.0%} tolerance: "
+            + ", ".join(sorted(regressions)),
+            style="error",
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
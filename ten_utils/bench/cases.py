@@ -0,0 +1,340 @@
+from functools import cache, partial
+from pathlib import Path
+from typing import Callable, Iterator
+import atexit
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from rich.console import Console
+
+from .._common import CONSOLE_THEME, LOGGER_INFO
+from ..buffer import Buffer, BufferNamespace
+from ..env_loader import EnvLoader
+from ..log import Logger
+
+
+ENV_PREFIX = "TEN_UTILS_BENCH_"
+ENV_VALUES = {
+    str: "hello",
+    int: "42",
+    float: "3.14",
+    bool: "yes",
+    list: "a,b,c",
+    tuple: "x,y,z",
+    dict: '{"a": 1, "b": [2, 3]}',
+}
+
+
+class BenchmarkCase:
+    """
+    A single named benchmark.
+
+    Attributes:
+        name (str): Dotted benchmark name, e.g. "logger.info.enabled".
+        run (Callable[[int], float]): Performs `number` operations and returns
+            the elapsed wall-clock time in seconds.
+        number (int): Default number of operations per measurement.
+    """
+
+    def __init__(self, name: str, run: Callable[[int], float], number: int):
+        self.name = name
+        self.run = run
+        self.number = number
+
+
+def timed(operation: Callable[[], object]) -> Callable[[int], float]:
+    """
+    Wrap a zero-argument callable into a `BenchmarkCase.run` function.
+
+    Args:
+        operation (Callable[[], object]): The operation to time.
+
+    Returns:
+        Callable[[int], float]: Function calling `operation` `number` times and
+            returning the elapsed time in seconds.
+    """
+
+    def run(number: int) -> float:
+        iterations = range(number)
+        start = time.perf_counter()
+
+        for _ in iterations:
+            operation()
+
+        return time.perf_counter() - start
+
+    return run
+
+
+def lazy(make_run: Callable[[], Callable[[int], float]]) -> Callable[[int], float]:
+    """
+    Defer building a `BenchmarkCase.run` function until the case first runs.
+
+    Cases filtered out with `-k` therefore never create their fixtures
+    (temporary files, open handles, Buffer namespaces).
+
+    Args:
+        make_run (Callable[[], Callable[[int], float]]): Builds the run function.
+
+    Returns:
+        Callable[[int], float]: Run function calling `make_run` once on first use.
+    """
+    make_run = cache(make_run)
+
+    def run(number: int) -> float:
+        return make_run()(number)
+
+    return run
+
+
+def thread_counts(max_threads: int) -> list[int]:
+    """
+    Return the thread counts measured by the Buffer benchmarks.
+
+    Args:
+        max_threads (int): Largest thread count, at least 1.
+
+    Returns:
+        list[int]: Powers of two below `max_threads`, followed by `max_threads`.
+    """
+    counts = []
+    threads = 1
+
+    while threads < max_threads:
+        counts.append(threads)
+        threads *= 2
+
+    return [*counts, max_threads]
+
+
+def iter_cases(max_threads: int = 4) -> Iterator[BenchmarkCase]:
+    """
+    Yield every built-in benchmark.
+
+    Fixtures are created lazily when a case first runs, so iterating the
+    cases has no side effects.
+
+    Args:
+        max_threads (int): Largest thread count for the Buffer benchmarks.
+            Thread counts double from 1 and always include this value.
+
+    Yields:
+        BenchmarkCase: The benchmarks, grouped by component.
+
+    Raises:
+        ValueError: If `max_threads` is less than 1.
+    """
+    if max_threads < 1:
+        raise ValueError("The 'max_threads' argument must be greater than 0")
+
+    yield from _logger_cases()
+    yield from _env_loader_cases()
+    yield from _buffer_cases(max_threads)
+    yield from _import_cases()
+
+
+def _logger_cases() -> Iterator[BenchmarkCase]:
+    @cache
+    def setup() -> Logger:
+        devnull = open(os.devnull, "w")
+        atexit.register(devnull.close)
+        logger = Logger(name="Bench")
+        logger.console = Console(file=devnull, theme=CONSOLE_THEME, force_terminal=True)
+        return logger
+
+    def with_info_level(make_operation: Callable[[Logger], Callable[[], object]]) -> Callable[[int], float]:
+        @lazy
+        def timed_operation() -> Callable[[int], float]:
+            return timed(make_operation(setup()))
+
+        def run(number: int) -> float:
+            previous_level = Logger.get_logger_level()
+            Logger.set_logger_level(LOGGER_INFO)
+
+            try:
+                return timed_operation(number)
+            finally:
+                Logger.set_logger_level(previous_level)
+
+        return run
+
+    yield BenchmarkCase(
+        name="logger.debug.disabled",
+        run=with_info_level(lambda logger: lambda: logger.debug("message", 42)),
+        number=100_000,
+    )
+    yield BenchmarkCase(
+        name="logger.info.enabled",
+        run=with_info_level(lambda logger: lambda: logger.info("message", 42)),
+        number=2_000,
+    )
+    yield BenchmarkCase(
+        name="logger.info.enabled.plain",
+        run=with_info_level(lambda logger: lambda: logger.info("message", 42, additional_info=False)),
+        number=2_000,
+    )
+
+
+def _env_loader_cases() -> Iterator[BenchmarkCase]:
+    @cache
+    def setup() -> Path:
+        with tempfile.NamedTemporaryFile("w", prefix="ten_utils_bench_", suffix=".env", delete=False) as file:
+            file.writelines(
+                f"{ENV_PREFIX}{type_env_var.__name__.upper()}={value}\n"
+                for type_env_var, value in ENV_VALUES.items()
+            )
+
+        env_file = Path(file.name)
+        atexit.register(env_file.unlink, missing_ok=True)
+        return env_file
+
+    def restoring_environ(run: Callable[[int], float]) -> Callable[[int], float]:
+        # Loading the .env file exports its variables; undo that after every
+        # measurement so the benchmarks leave os.environ as they found it.
+        def restored_run(number: int) -> float:
+            environ = os.environ.copy()
+
+            try:
+                return run(number)
+            finally:
+                os.environ.clear()
+                os.environ.update(environ)
+
+        return restored_run
+
+    def load(name_env: str, type_env_var: type) -> Callable[[int], float]:
+        def run(number: int) -> float:
+            loader = EnvLoader(path_to_env_file=setup())
+            return timed(partial(loader.load, name_env, type_env_var))(number)
+
+        return restoring_environ(run)
+
+    yield BenchmarkCase(
+        name="env_loader.init.file",
+        run=restoring_environ(lambda number: timed(partial(EnvLoader, path_to_env_file=setup()))(number)),
+        number=1_000,
+    )
+    yield BenchmarkCase(
+        name="env_loader.init.getenv",
+        run=timed(lambda: EnvLoader(getenv_mode=True)),
+        number=100_000,
+    )
+
+    for type_env_var in ENV_VALUES:
+        yield BenchmarkCase(
+            name=f"env_loader.load.{type_env_var.__name__}",
+            run=load(f"{ENV_PREFIX}{type_env_var.__name__.upper()}", type_env_var),
+            number=50_000,
+        )
+
+
+def _buffer_cases(max_threads: int) -> Iterator[BenchmarkCase]:
+    keys = [f"key:{index}" for index in range(1_000)]
+
+    @cache
+    def setup() -> BufferNamespace:
+        namespace = Buffer().namespace("__bench__")
+        namespace.set_many(dict.fromkeys(keys, "value"))
+        return namespace
+
+    def threaded(
+        make_operation: Callable[[BufferNamespace], Callable[[str], object]],
+        threads: int,
+    ) -> Callable[[int], float]:
+        def run(number: int) -> float:
+            operation = make_operation(setup())
+            per_thread = max(number // threads, 1)
+            barrier = threading.Barrier(threads + 1)
+
+            def worker() -> None:
+                barrier.wait()
+
+                for index in range(per_thread):
+                    operation(keys[index % len(keys)])
+
+            workers = [threading.Thread(target=worker) for _ in range(threads)]
+            for thread in workers:
+                thread.start()
+
+            barrier.wait()
+            start = time.perf_counter()
+
+            for thread in workers:
+                thread.join()
+
+            return (time.perf_counter() - start) * number / (per_thread * threads)
+
+        return run
+
+    for threads in thread_counts(max_threads):
+        yield BenchmarkCase(
+            name=f"buffer.get.threads-{threads}",
+            run=threaded(lambda namespace: namespace.get, threads),
+            number=200_000,
+        )
+        yield BenchmarkCase(
+            name=f"buffer.set.threads-{threads}",
+            run=threaded(lambda namespace: lambda key: namespace.set(key, "value"), threads),
+            number=100_000,
+        )
+
+    rng = random.Random(0)
+
+    def insert_new_keys(number: int) -> float:
+        growing = Buffer().namespace("__bench_insert__")
+        growing.clear()
+        new_keys = [f"{rng.getrandbits(64):016x}" for _ in range(number)]
+        set_value = growing.set
+        start = time.perf_counter()
+
+        for key in new_keys:
+            set_value(key, "value")
+
+        elapsed = time.perf_counter() - start
+        growing.clear()
+        return elapsed
+
+    yield BenchmarkCase(
+        name="buffer.set.new-keys",
+        run=insert_new_keys,
+        number=100_000,
+    )
+
+
+def _import_cases() -> Iterator[BenchmarkCase]:
+    package_root = str(Path(__file__).resolve().parents[2])
+    python_path = os.pathsep.join(filter(None, [package_root, os.getenv("PYTHONPATH")]))
+    env = {**os.environ, "PYTHONPATH": python_path}
+
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import ten_utils\n"
+        "print(time.perf_counter() - start)\n"
+    )
+
+    def run(number: int) -> float:
+        elapsed = 0.0
+
+        for _ in range(number):
+            process = subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            elapsed += float(process.stdout)
+
+        return elapsed
+
+    yield BenchmarkCase(
+        name="import.ten_utils",
+        run=run,
+        number=5,
+    )
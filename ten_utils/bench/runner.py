@@ -0,0 +1,117 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+import json
+import platform
+import sys
+
+from .cases import BenchmarkCase
+
+
+def run_benchmarks(
+    cases: Iterable[BenchmarkCase],
+    pattern: str | None = None,
+    repeat: int = 5,
+    scale: float = 1.0,
+) -> dict[str, float]:
+    """
+    Measure benchmarks and return the best time per operation of each.
+
+    Every case is run `repeat` times and the fastest run is kept, which is
+    the measurement least affected by unrelated system noise.
+
+    Args:
+        cases (Iterable[BenchmarkCase]): The benchmarks to run.
+        pattern (str | None): Only run benchmarks whose name contains this substring.
+        repeat (int): Number of measurements per benchmark.
+        scale (float): Multiplier applied to the number of operations of every case.
+
+    Returns:
+        dict[str, float]: Seconds per operation, keyed by benchmark name.
+
+    Raises:
+        ValueError: If `repeat` or `scale` is not positive.
+    """
+    if repeat <= 0:
+        raise ValueError("The 'repeat' argument must be greater than 0")
+
+    if scale <= 0:
+        raise ValueError("The 'scale' argument must be greater than 0")
+
+    results = {}
+
+    for case in cases:
+        if pattern is not None and pattern not in case.name:
+            continue
+
+        number = max(int(case.number * scale), 1)
+        results[case.name] = min(case.run(number) for _ in range(repeat)) / number
+
+    return results
+
+
+def compare_results(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float = 0.25,
+) -> dict[str, float]:
+    """
+    Find benchmarks that got slower than the baseline allows.
+
+    Benchmarks missing from either side are skipped.
+
+    Args:
+        results (dict[str, float]): Current seconds per operation.
+        baseline (dict[str, float]): Reference seconds per operation.
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        dict[str, float]: Ratio of current to baseline time for every regression.
+    """
+    regressions = {}
+
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+
+        ratio = seconds / reference
+        if ratio > 1 + tolerance:
+            regressions[name] = ratio
+
+    return regressions
+
+
+def save_results(path: str | Path, results: dict[str, float]) -> None:
+    """
+    Write benchmark results to a JSON file together with environment metadata.
+
+    Args:
+        path (str | Path): Destination file.
+        results (dict[str, float]): Seconds per operation, keyed by benchmark name.
+    """
+    document = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    Path(path).write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: str | Path) -> dict[str, float]:
+    """
+    Read benchmark results written by `save_results`.
+
+    Args:
+        path (str | Path): The JSON file to read.
+
+    Returns:
+        dict[str, float]: Seconds per operation, keyed by benchmark name.
+    """
+    document: dict[str, Any] = json.loads(Path(path).read_text())
+    return document["results"]
@@ -0,0 +1,12 @@
+from .buffer import Buffer
+from .namespace import BufferNamespace
+from .serializers import PickleSerializer, JsonSerializer
+from .stats import BufferStats
+
+__all__ = [
+    "Buffer",
+    "BufferNamespace",
+    "BufferStats",
+    "PickleSerializer",
+    "JsonSerializer",
+]
@@ -0,0 +1,51 @@
+from typing import Callable
+import threading
+
+from ..log import Logger
+
+
+class PeriodicTask:
+    """
+    Run a callable every `interval` seconds in a background daemon thread.
+
+    An exception raised by the callable is logged and the next run still
+    happens on schedule, so a transient failure (e.g. a full disk) does not
+    silently stop the task.
+    """
+
+    def __init__(self, function: Callable[[], None], interval: float, name: str):
+        """
+        Start the background thread.
+
+        Args:
+            function (Callable[[], None]): The callable to run periodically.
+            interval (float): Number of seconds between two runs.
+            name (str): Name of the background thread.
+
+        Raises:
+            ValueError: If `interval` is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("The 'interval' argument must be greater than 0")
+
+        self._function = function
+        self._interval = interval
+        self._logger = Logger(name=name)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread and wait for the current run to finish.
+        """
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self._function()
+
+            except Exception as error:
+                self._logger.error(f"Periodic task failed: {error!r}")
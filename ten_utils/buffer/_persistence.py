@@ -0,0 +1,331 @@
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+import os
+import re
+import struct
+import tempfile
+
+from ..errors import FailedLoadBufferFile, FailedSerializeBufferRecord
+
+
+FILE_HEADER = b"TENBUF2\n"
+RECORD_LENGTH = struct.Struct(">I")
+
+
+def write_snapshot(path: str | Path, records: Iterable[Any], serializer: Any) -> None:
+    """
+    Atomically write a sequence of records to a snapshot file.
+
+    The records are written to a temporary file in the same directory, flushed
+    to disk and then renamed over `path`, so readers only ever see either the
+    previous snapshot or the complete new one.
+
+    Args:
+        path (str | Path): Destination of the snapshot.
+        records (Iterable[Any]): Records to serialize, in replay order.
+        serializer (Any): Object providing `dumps(obj) -> bytes`.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(FILE_HEADER)
+
+            for record in records:
+                write_record(file, record, serializer)
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tmp_name, path)
+
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+
+        raise
+
+    _fsync_directory(path.parent)
+
+
+def write_record(file: BinaryIO, record: Any, serializer: Any) -> None:
+    """
+    Append a single length-prefixed record to an open binary file.
+
+    Args:
+        file (BinaryIO): File opened for binary writing.
+        record (Any): The record to serialize.
+        serializer (Any): Object providing `dumps(obj) -> bytes`.
+
+    Raises:
+        FailedSerializeBufferRecord: If the serializer rejects the record.
+    """
+    file.write(encode_record(record, serializer))
+
+
+def encode_record(record: Any, serializer: Any) -> bytes:
+    """
+    Serialize a record into its length-prefixed on-disk form.
+
+    Args:
+        record (Any): The record to serialize.
+        serializer (Any): Object providing `dumps(obj) -> bytes`.
+
+    Returns:
+        bytes: The length prefix followed by the serialized record.
+
+    Raises:
+        FailedSerializeBufferRecord: If the serializer rejects the record.
+    """
+    try:
+        payload = serializer.dumps(record)
+
+    except Exception as error:
+        raise FailedSerializeBufferRecord(serializer=serializer, error=error) from error
+
+    return RECORD_LENGTH.pack(len(payload)) + payload
+
+
+def iter_records(path: str | Path, serializer: Any) -> Iterator[Any]:
+    """
+    Lazily read records from a snapshot or write log file.
+
+    Records are yielded one at a time so the caller can apply them without
+    materializing the whole file. A truncated record at the end of the file
+    (left by a crash in the middle of an append) is silently ignored.
+
+    Args:
+        path (str | Path): The file to read.
+        serializer (Any): Object providing `loads(data: bytes) -> Any`.
+
+    Yields:
+        Any: Deserialized records in file order.
+
+    Raises:
+        FailedLoadBufferFile: If the header is invalid or a record cannot be deserialized.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(FILE_HEADER)) != FILE_HEADER:
+            raise FailedLoadBufferFile(path=path, reason="invalid file header")
+
+        while True:
+            prefix = file.read(RECORD_LENGTH.size)
+            if len(prefix) < RECORD_LENGTH.size:
+                return
+
+            (length,) = RECORD_LENGTH.unpack(prefix)
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+
+            try:
+                record = serializer.loads(payload)
+
+            except Exception as error:
+                raise FailedLoadBufferFile(
+                    path=path,
+                    reason=f"record cannot be deserialized ({error})",
+                ) from error
+
+            yield record
+
+
+class WriteLog:
+    """
+    Append-only log of Buffer mutations.
+
+    Every record is flushed to the operating system as soon as it is written.
+    With `fsync=True` it is also forced to disk, trading write throughput for
+    durability against power loss.
+    """
+
+    def __init__(self, path: str | Path, serializer: Any, fsync: bool = False):
+        """
+        Open (or create) the write log.
+
+        A record left half-written by a crash is cut off before appending, so
+        it cannot swallow the records written after the restart.
+
+        Args:
+            path (str | Path): Location of the log file.
+            serializer (Any): Object providing `dumps(obj) -> bytes`.
+            fsync (bool): Whether to fsync after every appended record.
+
+        Raises:
+            FailedLoadBufferFile: If the file exists and is not a buffer write log.
+        """
+        self.path = Path(path)
+        self.serializer = serializer
+        self.fsync = fsync
+        self._open()
+
+    def encode(self, record: Any) -> bytes:
+        """
+        Serialize a record without writing it.
+
+        Mutations encode their record before touching memory, so a record the
+        serializer rejects leaves both the buffer and the log unchanged.
+
+        Args:
+            record (Any): The record to serialize.
+
+        Returns:
+            bytes: The encoded record, ready for `write`.
+
+        Raises:
+            FailedSerializeBufferRecord: If the serializer rejects the record.
+        """
+        return encode_record(record, self.serializer)
+
+    def write(self, data: bytes) -> None:
+        """
+        Append a record encoded by `encode` to the log.
+
+        Args:
+            data (bytes): The encoded record.
+        """
+        self._file.write(data)
+        self._sync()
+
+    def rotate(self) -> Path:
+        """
+        Move the current records aside and continue in an empty log.
+
+        The records are renamed to the next free `rotated_paths` slot, so a
+        rotation never copies data, even when files left by earlier failed
+        snapshots are still there. If the rename or reopening fails, the log
+        is restored and stays usable.
+
+        Returns:
+            Path: The file holding the rotated records.
+        """
+        existing = rotated_paths(self.path)
+        number = int(existing[-1].suffix[1:]) + 1 if existing else 1
+        rotated = self.path.with_name(f"{self.path.name}.rotated.{number}")
+        self._file.close()
+
+        try:
+            os.replace(self.path, rotated)
+        except BaseException:
+            self._open()
+            raise
+
+        try:
+            self._open()
+        except BaseException:
+            os.replace(rotated, self.path)
+            self._open()
+            raise
+
+        return rotated
+
+    def close(self) -> None:
+        """
+        Close the underlying file.
+        """
+        self._file.close()
+
+    def _open(self) -> None:
+        size = self.path.stat().st_size if self.path.exists() else 0
+
+        if size >= len(FILE_HEADER):
+            end = find_records_end(self.path)
+
+        elif FILE_HEADER.startswith(self.path.read_bytes() if size else b""):
+            end = 0
+
+        else:
+            raise FailedLoadBufferFile(path=self.path, reason="invalid file header")
+
+        self._file = open(self.path, "ab")
+
+        if end < size:
+            self._file.truncate(end)
+
+        if end == 0:
+            self._file.write(FILE_HEADER)
+
+        self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+def find_records_end(path: str | Path) -> int:
+    """
+    Return the offset just past the last complete record of a buffer file.
+
+    Only the length prefixes are read, records are not deserialized.
+
+    Args:
+        path (str | Path): The file to inspect.
+
+    Returns:
+        int: Offset of the end of the last complete record.
+
+    Raises:
+        FailedLoadBufferFile: If the file header is invalid.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(FILE_HEADER)) != FILE_HEADER:
+            raise FailedLoadBufferFile(path=path, reason="invalid file header")
+
+        size = os.fstat(file.fileno()).st_size
+        end = file.tell()
+
+        while True:
+            prefix = file.read(RECORD_LENGTH.size)
+            if len(prefix) < RECORD_LENGTH.size:
+                return end
+
+            (length,) = RECORD_LENGTH.unpack(prefix)
+            if end + RECORD_LENGTH.size + length > size:
+                return end
+
+            end = file.seek(length, os.SEEK_CUR)
+
+
+def rotated_paths(path: str | Path) -> list[Path]:
+    """
+    Return the files `WriteLog.rotate` moved the records of the log at `path` to.
+
+    Args:
+        path (str | Path): Location of the write log.
+
+    Returns:
+        list[Path]: The rotated files, oldest first.
+    """
+    path = Path(path)
+    pattern = re.compile(rf"{re.escape(path.name)}\.rotated\.(\d+)")
+    numbered = []
+
+    if path.parent.is_dir():
+        for candidate in path.parent.iterdir():
+            match = pattern.fullmatch(candidate.name)
+            if match:
+                numbered.append((int(match.group(1)), candidate))
+
+    return [candidate for _, candidate in sorted(numbered)]
+
+
+def _fsync_directory(directory: Path) -> None:
+    """
+    Persist a rename by syncing its directory, where the platform supports it.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
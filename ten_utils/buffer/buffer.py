@@ -0,0 +1,390 @@
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+import threading
+
+from .._common import BUFFER_DEFAULT_NAMESPACE
+from ..errors import FailedLoadBufferFile
+from ..log import Logger
+from ..singleton import Singleton
+from .namespace import BufferNamespace
+from .stats import BufferStats, StatsCounters
+from ._periodic import PeriodicTask
+from ._persistence import WriteLog, iter_records, rotated_paths, write_snapshot
+from .serializers import PickleSerializer
+
+
+class Buffer(metaclass=Singleton):
+    """
+    Singleton in-memory key-value storage with namespaces and optional file persistence.
+
+    Keys live in namespaces (`namespace("sessions")`), each of which can be
+    cleared on its own and scanned by key prefix or range. The methods of the
+    buffer itself operate on the default namespace, except `clear`, which
+    empties every namespace.
+
+    The contents can be dumped to a snapshot file (once with `save` or
+    periodically with `start_snapshots`) and every mutation can be recorded
+    in an append-only write log (`open_write_log`). Both kinds of files are
+    read back with `load`, which makes it possible to warm the buffer up
+    after a restart instead of starting empty.
+
+    Serializers are pluggable: any object with `dumps(obj) -> bytes` and
+    `loads(data: bytes) -> Any` methods can be used. `PickleSerializer` is
+    the default.
+
+    Hits, misses, sets and evictions are counted per namespace once
+    `enable_stats` is called and can be read with `stats` or reported
+    periodically through a `Logger` with `start_stats_report`. While
+    statistics are disabled the only overhead is a single attribute check.
+    """
+
+    def __init__(self):
+        self.__lock = threading.RLock()
+        self.__save_lock = threading.Lock()
+        self.__write_log: WriteLog | None = None
+        self.__snapshots: PeriodicTask | None = None
+        self.__stats_report: PeriodicTask | None = None
+        self.__stats_enabled = False
+        self.__namespaces: dict[str, BufferNamespace] = {}
+        self.__default = self.namespace(BUFFER_DEFAULT_NAMESPACE)
+
+    def namespace(self, name: str) -> BufferNamespace:
+        """
+        Return the namespace called `name`, creating it if needed.
+
+        Args:
+            name (str): The namespace name.
+
+        Returns:
+            BufferNamespace: The namespace. Repeated calls return the same object.
+        """
+        namespace = self.__namespaces.get(name)
+        if namespace is not None:
+            return namespace
+
+        with self.__lock:
+            if name not in self.__namespaces:
+                namespace = BufferNamespace(
+                    name=name,
+                    lock=self.__lock,
+                    encode=self.__encode,
+                    write=self.__write,
+                )
+
+                if self.__stats_enabled:
+                    namespace._counters = StatsCounters()
+
+                self.__namespaces[name] = namespace
+
+            return self.__namespaces[name]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__default
+
+    def set(self, key: str, value: Any):
+        self.__default.set(key, value)
+
+    def get(self, key: str, default: Any = None):
+        return self.__default.get(key, default)
+
+    def delete(self, key: str) -> bool:
+        return self.__default.delete(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        return self.__default.get_many(keys)
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        self.__default.set_many(items)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        return self.__default.delete_many(keys)
+
+    def scan_prefix(self, prefix: str) -> list[tuple[str, Any]]:
+        return self.__default.scan_prefix(prefix)
+
+    def scan_range(self, start: str | None = None, end: str | None = None) -> list[tuple[str, Any]]:
+        return self.__default.scan_range(start, end)
+
+    def clear(self):
+        with self.__lock:
+            for namespace in self.__namespaces.values():
+                namespace.clear()
+
+    def save(self, path: str | Path, serializer: Any = PickleSerializer) -> None:
+        """
+        Atomically write a snapshot of the buffer to a file.
+
+        The snapshot is written to a temporary file and renamed over `path`,
+        so a crash never leaves a half-written snapshot behind. Only copying
+        the entry references happens under the buffer lock; serialization and
+        disk writes do not block writers.
+
+        If a write log is open, it is rotated at the moment of the copy: the
+        records covered by the snapshot are renamed to a numbered `.rotated.N`
+        file next to the log, which is deleted (along with any older ones) once
+        the snapshot is in place. Should the snapshot fail, `load` of the write
+        log replays the rotated records too.
+
+        Args:
+            path (str | Path): Destination of the snapshot.
+            serializer (Any): Serializer used for the records. Defaults to `PickleSerializer`.
+
+        Raises:
+            FailedSerializeBufferRecord: If the serializer rejects a stored value.
+        """
+        with self.__save_lock:
+            with self.__lock:
+                items = [
+                    (namespace.name, list(namespace._data.items()))
+                    for namespace in self.__namespaces.values()
+                ]
+                rotated = log_path = None
+
+                if self.__write_log is not None:
+                    log_path = self.__write_log.path
+                    rotated = self.__write_log.rotate()
+
+            write_snapshot(path, self.__iter_set_records(items), serializer)
+
+            if rotated is not None:
+                for covered in rotated_paths(log_path):
+                    covered.unlink(missing_ok=True)
+
+                    if covered == rotated:
+                        break
+
+    def load(self, path: str | Path, serializer: Any = PickleSerializer) -> int:
+        """
+        Load a snapshot or write log into the buffer.
+
+        Records are streamed from the file and applied one by one, so the file
+        is never held in memory alongside the buffer. Loaded entries are
+        merged into the current contents and are not written to the write log.
+        A missing file is treated as empty, which allows calling `load`
+        unconditionally at startup. Records of a write log that were rotated
+        by an unfinished `save` are replayed before the log itself.
+
+        Args:
+            path (str | Path): The snapshot or write log to read.
+            serializer (Any): Serializer the file was written with. Defaults to `PickleSerializer`.
+
+        Returns:
+            int: Number of records applied.
+
+        Raises:
+            FailedLoadBufferFile: If the file is not a valid buffer file.
+        """
+        applied = 0
+
+        with self.__lock:
+            for file_path in (*rotated_paths(path), Path(path)):
+                if not file_path.exists():
+                    continue
+
+                for record in iter_records(file_path, serializer):
+                    try:
+                        self.__apply(record)
+
+                    except (IndexError, KeyError, TypeError, ValueError) as error:
+                        raise FailedLoadBufferFile(
+                            path=file_path,
+                            reason=f"unexpected record {record!r}",
+                        ) from error
+
+                    applied += 1
+
+        return applied
+
+    def open_write_log(
+        self,
+        path: str | Path,
+        serializer: Any = PickleSerializer,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Start recording every mutation in an append-only write log.
+
+        An already open write log is closed first.
+
+        Args:
+            path (str | Path): Location of the log file. Existing records are kept.
+            serializer (Any): Serializer used for the records. Defaults to `PickleSerializer`.
+            fsync (bool): Whether to force every record to disk. Defaults to False.
+        """
+        with self.__lock:
+            self.close_write_log()
+            self.__write_log = WriteLog(path=path, serializer=serializer, fsync=fsync)
+
+    def close_write_log(self) -> None:
+        """
+        Stop recording mutations and close the write log, if one is open.
+        """
+        with self.__lock:
+            if self.__write_log is not None:
+                self.__write_log.close()
+                self.__write_log = None
+
+    def start_snapshots(
+        self,
+        path: str | Path,
+        interval: float,
+        serializer: Any = PickleSerializer,
+    ) -> None:
+        """
+        Save a snapshot every `interval` seconds in a background daemon thread.
+
+        Already running periodic snapshots are stopped first.
+
+        Args:
+            path (str | Path): Destination of the snapshots.
+            interval (float): Number of seconds between two snapshots.
+            serializer (Any): Serializer used for the records. Defaults to `PickleSerializer`.
+
+        Raises:
+            ValueError: If `interval` is not positive.
+        """
+        self.stop_snapshots()
+        self.__snapshots = PeriodicTask(
+            function=lambda: self.save(path, serializer=serializer),
+            interval=interval,
+            name="BufferSnapshots",
+        )
+
+    def stop_snapshots(self) -> None:
+        """
+        Stop periodic snapshots started with `start_snapshots`, if any.
+        """
+        if self.__snapshots is not None:
+            self.__snapshots.stop()
+            self.__snapshots = None
+
+    def enable_stats(self) -> None:
+        """
+        Start counting hits, misses, sets and evictions in every namespace.
+
+        Counters start from zero, including when statistics were already enabled.
+        """
+        with self.__lock:
+            self.__stats_enabled = True
+
+            for namespace in self.__namespaces.values():
+                namespace._counters = StatsCounters()
+
+    def disable_stats(self) -> None:
+        """
+        Stop counting and drop the collected counters.
+        """
+        with self.__lock:
+            self.__stats_enabled = False
+
+            for namespace in self.__namespaces.values():
+                namespace._counters = None
+
+    def stats(self, memory: bool = False) -> dict[str, BufferStats]:
+        """
+        Return a snapshot of the statistics of every namespace.
+
+        Args:
+            memory (bool): Whether to compute the approximate deep memory footprint
+                of each namespace. This walks every stored value, so it is off by
+                default; the walk runs outside the buffer lock.
+
+        Returns:
+            dict[str, BufferStats]: Statistics keyed by namespace name.
+        """
+        with self.__lock:
+            namespaces = list(self.__namespaces.items())
+
+        return {name: namespace.stats(memory=memory) for name, namespace in namespaces}
+
+    def start_stats_report(
+        self,
+        interval: float,
+        logger: Logger | None = None,
+        memory: bool = False,
+    ) -> None:
+        """
+        Log the statistics of every namespace every `interval` seconds.
+
+        Statistics are enabled if they are not already. A running report is
+        stopped first.
+
+        Args:
+            interval (float): Number of seconds between two reports.
+            logger (Logger | None): Logger used for the reports. Defaults to a
+                `Logger` named "Buffer".
+            memory (bool): Whether to include the approximate memory footprint.
+
+        Raises:
+            ValueError: If `interval` is not positive.
+        """
+        logger = logger or Logger(name="Buffer")
+
+        def report() -> None:
+            for stats in self.stats(memory=memory).values():
+                logger.info(
+                    f"namespace={stats.namespace!r} entries={stats.entries} "
+                    f"hits={stats.hits} misses={stats.misses} "
+                    f"hit_ratio={stats.hit_ratio:.2%} sets={stats.sets} "
+                    f"evictions={stats.evictions}"
+                    + (f" memory={stats.memory}B" if stats.memory is not None else "")
+                )
+
+        self.stop_stats_report()
+
+        if not self.__stats_enabled:
+            self.enable_stats()
+
+        self.__stats_report = PeriodicTask(
+            function=report,
+            interval=interval,
+            name="BufferStatsReport",
+        )
+
+    def stop_stats_report(self) -> None:
+        """
+        Stop the periodic report started with `start_stats_report`, if any.
+
+        Statistics stay enabled; call `disable_stats` to stop counting.
+        """
+        if self.__stats_report is not None:
+            self.__stats_report.stop()
+            self.__stats_report = None
+
+    def __encode(self, record: tuple) -> bytes | None:
+        if self.__write_log is None:
+            return None
+
+        return self.__write_log.encode(record)
+
+    def __write(self, data: bytes | None) -> None:
+        if data is not None:
+            self.__write_log.write(data)
+
+    def __apply(self, record: list | tuple) -> None:
+        operation, name = record[0], record[1]
+        if not isinstance(name, str):
+            raise TypeError(f"Namespace name must be a string, got {name!r}")
+
+        namespace = self.namespace(name)
+
+        if operation == "set":
+            namespace._set(record[2], record[3])
+
+        elif operation == "set_many":
+            namespace._set_many(dict(record[2]))
+
+        elif operation == "delete_many":
+            namespace._delete_many(key for key in record[2] if key in namespace)
+
+        elif operation == "clear":
+            namespace._clear()
+
+        else:
+            raise ValueError(f"Unknown buffer record operation {operation!r}")
+
+    @staticmethod
+    def __iter_set_records(items):
+        for name, namespace_items in items:
+            for key, value in namespace_items:
+                yield "set", name, key, value
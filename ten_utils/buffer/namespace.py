@@ -0,0 +1,364 @@
+from bisect import bisect_left, insort
+from dataclasses import replace
+from itertools import chain
+from typing import Any, Callable, Iterable, Mapping
+import sys
+import threading
+
+from .stats import BufferStats, StatsCounters, deep_sizeof
+
+
+_MISSING = object()
+INDEX_PATCH_LIMIT = 128
+
+
+class BufferNamespace:
+    """
+    An independent keyspace inside a `Buffer`.
+
+    Besides the dictionary holding the values, every namespace can keep a
+    sorted list of its keys, so `scan_prefix` and `scan_range` locate matches
+    by binary search instead of walking the dictionary. The index is built by
+    the first scan and maintained lazily: inserts and deletes only note the
+    key in O(1), and the next scan applies the notes. Up to
+    `INDEX_PATCH_LIMIT` notes are applied in place with a binary search each;
+    beyond that a single merge over the index is cheaper. If the notes
+    outgrow the index, it is dropped and rebuilt on demand, so namespaces
+    that are never scanned pay nothing for it.
+
+    Namespaces are created with `Buffer.namespace` and share the lock, the
+    write log and the statistics switch of the buffer that owns them.
+
+    Attributes:
+        name (str): The namespace name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lock: threading.RLock,
+        encode: Callable[[tuple], bytes | None],
+        write: Callable[[bytes | None], None],
+    ):
+        """
+        Initialize an empty namespace.
+
+        Args:
+            name (str): The namespace name.
+            lock (threading.RLock): Lock shared with the owning buffer.
+            encode (Callable[[tuple], bytes | None]): Callback that serializes a
+                mutation record for the write log, or returns None if no log is open.
+            write (Callable[[bytes | None], None]): Callback that appends an
+                encoded record to the write log.
+        """
+        self.name = name
+        self._lock = lock
+        self._encode = encode
+        self._write = write
+        self._data: dict[str, Any] = {}
+        self._keys: list[str] | None = None
+        self._pending: set[str] = set()
+        self._removed: set[str] = set()
+        self._counters: StatsCounters | None = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value under `key`.
+
+        Args:
+            key (str): The key to store the value under.
+            value (Any): The value to store.
+        """
+        with self._lock:
+            data = self._encode(("set", self.name, key, value))
+            self._set(key, value)
+            self._write(data)
+
+            if self._counters is not None:
+                self._counters.sets += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return the value stored under `key`.
+
+        Args:
+            key (str): The key to look up.
+            default (Any): Value returned when the key is missing. Defaults to None.
+
+        Returns:
+            Any: The stored value or `default`.
+        """
+        counters = self._counters
+        if counters is None:
+            return self._data.get(key, default)
+
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            counters.misses += 1
+            return default
+
+        counters.hits += 1
+        return value
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove `key` from the namespace.
+
+        Args:
+            key (str): The key to remove.
+
+        Returns:
+            bool: True if the key existed.
+        """
+        with self._lock:
+            if key not in self._data:
+                return False
+
+            data = self._encode(("delete_many", self.name, [key]))
+            self._delete_many((key,))
+            self._write(data)
+
+            if self._counters is not None:
+                self._counters.evictions += 1
+
+            return True
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Return the values stored under several keys.
+
+        Args:
+            keys (Iterable[str]): The keys to look up.
+
+        Returns:
+            dict[str, Any]: The found keys mapped to their values. Missing keys
+                are left out, so a stored None is distinguishable from a miss.
+        """
+        data = self._data
+        counters = self._counters
+
+        if counters is None:
+            return {key: data[key] for key in keys if key in data}
+
+        keys = list(keys)
+        found = {key: data[key] for key in keys if key in data}
+        counters.hits += len(found)
+        counters.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """
+        Store several values at once, under a single lock acquisition.
+
+        Args:
+            items (Mapping[str, Any]): Keys mapped to the values to store.
+        """
+        items = dict(items)
+
+        with self._lock:
+            data = self._encode(("set_many", self.name, items))
+            self._set_many(items)
+            self._write(data)
+
+            if self._counters is not None:
+                self._counters.sets += len(items)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Remove several keys at once, under a single lock acquisition.
+
+        Args:
+            keys (Iterable[str]): The keys to remove. Missing keys are ignored.
+
+        Returns:
+            int: Number of keys that were removed.
+        """
+        with self._lock:
+            removed = [key for key in dict.fromkeys(keys) if key in self._data]
+
+            if removed:
+                data = self._encode(("delete_many", self.name, removed))
+                self._delete_many(removed)
+                self._write(data)
+
+                if self._counters is not None:
+                    self._counters.evictions += len(removed)
+
+            return len(removed)
+
+    def clear(self) -> None:
+        """
+        Remove every key of this namespace in constant time.
+
+        Other namespaces are not affected.
+        """
+        with self._lock:
+            data = self._encode(("clear", self.name))
+
+            if self._counters is not None:
+                self._counters.evictions += len(self._data)
+
+            self._clear()
+            self._write(data)
+
+    def scan_prefix(self, prefix: str) -> list[tuple[str, Any]]:
+        """
+        Return the entries whose key starts with `prefix`, ordered by key.
+
+        Args:
+            prefix (str): The key prefix to match.
+
+        Returns:
+            list[tuple[str, Any]]: Matching `(key, value)` pairs.
+        """
+        with self._lock:
+            keys = self._index()
+            start = bisect_left(keys, prefix)
+            end = start
+
+            while end < len(keys) and keys[end].startswith(prefix):
+                end += 1
+
+            return [(key, self._data[key]) for key in keys[start:end]]
+
+    def scan_range(self, start: str | None = None, end: str | None = None) -> list[tuple[str, Any]]:
+        """
+        Return the entries with `start <= key < end`, ordered by key.
+
+        Args:
+            start (str | None): Inclusive lower bound. None means unbounded.
+            end (str | None): Exclusive upper bound. None means unbounded.
+
+        Returns:
+            list[tuple[str, Any]]: Matching `(key, value)` pairs.
+        """
+        with self._lock:
+            keys = self._index()
+            low = 0 if start is None else bisect_left(keys, start)
+            high = len(keys) if end is None else bisect_left(keys, end, lo=low)
+
+            return [(key, self._data[key]) for key in keys[low:high]]
+
+    def stats(self, memory: bool = False) -> BufferStats:
+        """
+        Return a snapshot of the namespace statistics.
+
+        Args:
+            memory (bool): Whether to compute the approximate deep memory footprint.
+                This walks every stored value, so it is off by default. Only the
+                entry references are copied under the lock; the walk itself
+                does not block writers. A value stored in several namespaces is
+                counted in each of them.
+
+        Returns:
+            BufferStats: The statistics. Counters are zero while statistics are disabled.
+        """
+        counters = self._counters or StatsCounters()
+        items = None
+
+        with self._lock:
+            snapshot = BufferStats(
+                namespace=self.name,
+                hits=counters.hits,
+                misses=counters.misses,
+                sets=counters.sets,
+                evictions=counters.evictions,
+                entries=len(self._data),
+            )
+
+            if memory:
+                containers = sys.getsizeof(self._data) + sys.getsizeof(self._keys or [])
+                items = list(self._data.items())
+
+        if items is None:
+            return snapshot
+
+        return replace(snapshot, memory=containers + deep_sizeof(*chain.from_iterable(items)))
+
+    def _set(self, key: str, value: Any) -> None:
+        if key not in self._data:
+            self._note_inserted(key)
+
+        self._data[key] = value
+
+    def _set_many(self, items: dict[str, Any]) -> None:
+        for key in items:
+            if key not in self._data:
+                self._note_inserted(key)
+
+        self._data.update(items)
+
+    def _delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            del self._data[key]
+            self._note_deleted(key)
+
+    def _clear(self) -> None:
+        self._data = {}
+        self._keys = None
+        self._pending = set()
+        self._removed = set()
+
+    def _note_inserted(self, key: str) -> None:
+        if self._keys is None:
+            return
+
+        if key in self._removed:
+            self._removed.discard(key)
+        else:
+            self._pending.add(key)
+            self._check_index_size()
+
+    def _note_deleted(self, key: str) -> None:
+        if self._keys is None:
+            return
+
+        if key in self._pending:
+            self._pending.discard(key)
+        else:
+            self._removed.add(key)
+            self._check_index_size()
+
+    def _check_index_size(self) -> None:
+        if len(self._pending) + len(self._removed) > len(self._keys):
+            self._keys = None
+            self._pending.clear()
+            self._removed.clear()
+
+    def _index(self) -> list[str]:
+        if self._keys is None:
+            self._keys = sorted(self._data)
+            return self._keys
+
+        keys = self._keys
+
+        if self._removed:
+            removed = self._removed
+
+            if len(removed) <= INDEX_PATCH_LIMIT:
+                for key in removed:
+                    del keys[bisect_left(keys, key)]
+            else:
+                keys[:] = [key for key in keys if key not in removed]
+
+            self._removed = set()
+
+        if self._pending:
+            pending = self._pending
+
+            if len(pending) <= INDEX_PATCH_LIMIT:
+                for key in pending:
+                    insort(keys, key)
+            else:
+                keys.extend(pending)
+                keys.sort()
+
+            self._pending = set()
+
+        return keys
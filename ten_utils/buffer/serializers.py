@@ -0,0 +1,75 @@
+from typing import Any
+import json
+import pickle
+
+
+class PickleSerializer:
+    """
+    Serializer backed by the standard `pickle` module.
+
+    Supports any picklable Python object, which makes it the default choice
+    for `Buffer` persistence. Only load files produced by a trusted source:
+    unpickling untrusted data can execute arbitrary code.
+    """
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to bytes.
+
+        Args:
+            obj (Any): The object to serialize.
+
+        Returns:
+            bytes: The pickled representation of the object.
+        """
+        return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        """
+        Deserialize bytes produced by `dumps`.
+
+        Args:
+            data (bytes): The pickled data.
+
+        Returns:
+            Any: The restored object.
+        """
+        return pickle.loads(data)
+
+
+class JsonSerializer:
+    """
+    Serializer backed by the standard `json` module.
+
+    Produces human-readable records but only supports JSON-compatible values
+    (str, int, float, bool, None, list and dict with string keys). Tuples are
+    restored as lists.
+    """
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        Args:
+            obj (Any): The object to serialize.
+
+        Returns:
+            bytes: The JSON representation of the object.
+        """
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        """
+        Deserialize UTF-8 encoded JSON produced by `dumps`.
+
+        Args:
+            data (bytes): The JSON data.
+
+        Returns:
+            Any: The restored object.
+        """
+        return json.loads(data)
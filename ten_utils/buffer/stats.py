@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+import sys
+
+
+@dataclass(frozen=True)
+class BufferStats:
+    """
+    Point-in-time statistics of a single `Buffer` namespace.
+
+    Counters are collected only while statistics are enabled with
+    `Buffer.enable_stats`. Lookups are lock-free, so under heavy concurrent
+    reads the hit and miss counters are approximate.
+
+    Attributes:
+        namespace (str): The namespace name.
+        hits (int): Lookups that found a key.
+        misses (int): Lookups of a missing key.
+        sets (int): Values stored.
+        evictions (int): Entries removed by `delete`, `delete_many` or `clear`.
+        entries (int): Number of entries at the time of the snapshot.
+        memory (int | None): Approximate deep size in bytes, or None if not requested.
+    """
+
+    namespace: str
+    hits: int
+    misses: int
+    sets: int
+    evictions: int
+    entries: int
+    memory: int | None = None
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Share of lookups that found a key, between 0.0 and 1.0.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class StatsCounters:
+    """
+    Mutable counters attached to a namespace while statistics are enabled.
+    """
+
+    __slots__ = ("hits", "misses", "sets", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+
+
+def deep_sizeof(*objs: Any) -> int:
+    """
+    Approximate the memory footprint of objects and everything they reference.
+
+    Containers (dict, list, tuple, set, frozenset) and instance `__dict__`s are
+    followed recursively; classes and modules are counted shallowly, and every
+    object is counted once, even if it is reachable from several of `objs`.
+
+    Args:
+        *objs (Any): The objects to measure. The caller must keep them alive
+            during the call, since objects are deduplicated by `id()`.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    seen = set()
+    size = 0
+    stack = list(objs)
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+
+        elif not isinstance(current, (type, ModuleType)) and hasattr(current, "__dict__"):
+            stack.append(vars(current))
+
+    return size
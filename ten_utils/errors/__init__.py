@@ -1,2 +1,4 @@
 from .base import TenUtilsLibError
 from .env_loader import *
+from .buffer import *
+from .singleton import *
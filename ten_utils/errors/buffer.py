@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Any
+
+from .base import TenUtilsLibError
+
+
+class FailedLoadBufferFile(TenUtilsLibError):
+    """
+    Raised when a Buffer snapshot or write log cannot be read.
+
+    Args:
+        path (str | Path): The path to the file that failed to load.
+        reason (str): A short description of what went wrong.
+
+    This error usually indicates that the file was not produced by `Buffer`,
+    or that it was written with a different serializer.
+
+    Usage example:
+        raise FailedLoadBufferFile("buffer.snapshot", "invalid file header")
+    """
+
+    def __init__(self, path: str | Path, reason: str):
+        super().__init__(
+            f"Failed to load the buffer file {str(path)!r}: {reason}."
+        )
+
+
+class FailedSerializeBufferRecord(TenUtilsLibError):
+    """
+    Raised when a Buffer record cannot be serialized for the write log or a snapshot.
+
+    Args:
+        serializer (Any): The serializer that rejected the record.
+        error (Exception): The error raised by the serializer.
+
+    The buffer is left unchanged when this error is raised by a mutation,
+    so memory and the write log never disagree.
+
+    Usage example:
+        raise FailedSerializeBufferRecord(JsonSerializer, TypeError("set is not JSON serializable"))
+    """
+
+    def __init__(self, serializer: Any, error: Exception):
+        super().__init__(
+            f"Failed to serialize a buffer record with {serializer!r}: {error}."
+        )
@@ -0,0 +1,47 @@
+from typing import Any
+
+from .base import TenUtilsLibError
+
+
+class UnhashableMultitonArguments(TenUtilsLibError):
+    """
+    Raised when a Multiton class is called with arguments that cannot be hashed.
+
+    Args:
+        args (tuple): The positional arguments of the call.
+        kwargs (dict[str, Any]): The keyword arguments of the call.
+
+    Multiton instances are cached under a key built from the constructor
+    arguments, so every argument must be hashable (e.g. a tuple instead of a list).
+
+    Usage example:
+        raise UnhashableMultitonArguments((["a"],), {})
+    """
+
+    def __init__(self, args: tuple, kwargs: dict[str, Any]):
+        super().__init__(
+            f"Multiton instances are keyed by their constructor arguments, "
+            f"but the arguments {args!r} {kwargs!r} are not hashable."
+        )
+
+
+class MultitonWeakReferencesUnsupported(TenUtilsLibError):
+    """
+    Raised when a Multiton class with `weak=True` cannot be weakly referenced.
+
+    Args:
+        cls_name (str): The name of the offending class.
+
+    This usually means the class defines `__slots__` without `__weakref__`.
+    The error is raised when the class is created, not on first instantiation.
+
+    Usage example:
+        raise MultitonWeakReferencesUnsupported("Pool")
+    """
+
+    def __init__(self, cls_name: str):
+        super().__init__(
+            f"The Multiton class {cls_name!r} uses weak=True, but its instances "
+            f"do not support weak references. Add '__weakref__' to its __slots__ "
+            f"or use weak=False."
+        )
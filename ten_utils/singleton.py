@@ -1,12 +1,115 @@
+import threading
+import weakref
+
+from .errors import MultitonWeakReferencesUnsupported, UnhashableMultitonArguments
+
+
 class Singleton(type):
+    """
+    Thread-safe metaclass that creates at most one instance per class.
+
+    Every class gets its own lock, taken only until the instance exists:
+    afterwards `__call__` is a single dictionary lookup. Constructor arguments
+    are used for the first call only and ignored afterwards; use `Multiton`
+    when instances must depend on them.
+
+    Example:
+        class Console(metaclass=Singleton):
+            pass
+
+        assert Console() is Console()
+    """
+
     _instances = {}
+    _locks = {}
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        Singleton._locks[cls] = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
 
-        return cls._instances[cls]
+        with cls._locks[cls]:
+            if cls not in cls._instances:
+                cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+
+            return cls._instances[cls]
 
     @classmethod
     def clear_instances(cls):
         cls._instances.clear()
+
+
+class Multiton(type):
+    """
+    Thread-safe metaclass that creates one instance per set of constructor arguments.
+
+    Instances are cached under a key built from the positional and keyword
+    arguments, so `Pool("db-a")` and `Pool("db-b")` are distinct objects while
+    repeated `Pool("db-a")` calls return the same one. Arguments must be
+    hashable. Passing the same value positionally and by keyword produces two
+    different keys.
+
+    With `weak=True` the cache holds weak references only, and an instance is
+    dropped as soon as nothing else references it. Such a class must support
+    weak references, which rules out `__slots__` without `__weakref__`.
+    Subclasses inherit the `weak` setting of their Multiton base unless they
+    pass it explicitly. Like `Singleton`, lookups of existing instances are
+    lock-free; construction is serialized per class.
+
+    Example:
+        class Pool(metaclass=Multiton, weak=True):
+            def __init__(self, url: str):
+                self.url = url
+
+        assert Pool("db-a") is Pool("db-a")
+        assert Pool("db-a") is not Pool("db-b")
+    """
+
+    _instances = {}
+    _locks = {}
+    _weak = {}
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict, weak: bool | None = None, **kwargs):
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, weak: bool | None = None, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+
+        if weak is None:
+            weak = next((Multiton._weak[base] for base in cls.__mro__[1:] if base in Multiton._weak), False)
+
+        if weak and not cls.__weakrefoffset__:
+            raise MultitonWeakReferencesUnsupported(cls_name=name)
+
+        Multiton._weak[cls] = weak
+        Multiton._instances[cls] = weakref.WeakValueDictionary() if weak else {}
+        Multiton._locks[cls] = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        instances = Multiton._instances[cls]
+
+        try:
+            instance = instances.get(key)
+        except TypeError:
+            raise UnhashableMultitonArguments(args=args, kwargs=kwargs) from None
+
+        if instance is not None:
+            return instance
+
+        with Multiton._locks[cls]:
+            instance = instances.get(key)
+            if instance is None:
+                instance = super(Multiton, cls).__call__(*args, **kwargs)
+                instances[key] = instance
+
+            return instance
+
+    @classmethod
+    def clear_instances(cls):
+        for instances in cls._instances.values():
+            instances.clear()
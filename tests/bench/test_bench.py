@@ -0,0 +1,111 @@
+import json
+import os
+
+import pytest
+
+from ten_utils import Buffer, Singleton
+from ten_utils.bench import (
+    BenchmarkCase,
+    compare_results,
+    iter_cases,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from ten_utils.bench.__main__ import main, parse_args
+
+
+@pytest.fixture(autouse=True)
+def reset_buffer_singleton():
+    Singleton.clear_instances()
+
+
+def test_run_benchmarks_filters_and_scales():
+    """
+    Verify that only matching cases run and times are reported per operation.
+    """
+    calls = []
+
+    def run(number):
+        calls.append(number)
+        return number * 2.0
+
+    cases = [
+        BenchmarkCase(name="a.fast", run=run, number=100),
+        BenchmarkCase(name="b.slow", run=run, number=100),
+    ]
+
+    results = run_benchmarks(cases, pattern="a.", repeat=3, scale=0.5)
+
+    assert results == {"a.fast": 2.0}
+    assert calls == [50, 50, 50]
+
+    with pytest.raises(ValueError):
+        run_benchmarks(cases, repeat=0)
+
+
+def test_compare_results_reports_regressions():
+    """
+    Verify that only slowdowns beyond the tolerance are reported.
+    """
+    baseline = {"same": 1.0, "slower": 1.0, "faster": 1.0, "removed": 1.0}
+    results = {"same": 1.2, "slower": 1.5, "faster": 0.5, "new": 9.0}
+
+    assert compare_results(results, baseline, tolerance=0.25) == {"slower": 1.5}
+
+
+def test_results_round_trip(tmp_path):
+    """
+    Verify that saved results can be loaded back and carry metadata.
+    """
+    path = tmp_path / "results.json"
+    save_results(path, {"a": 0.5})
+
+    assert load_results(path) == {"a": 0.5}
+    assert "python" in json.loads(path.read_text())["meta"]
+
+
+def test_cli_fails_on_regression(tmp_path):
+    """
+    Verify that the command exits with status 1 when the baseline is beaten.
+    """
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "buffer.get.threads-1", "--quick", "-r", "1", "-o", str(output), "-b", str(baseline)]
+
+    save_results(baseline, {"other.case": 1.0})
+    assert main([*args, "--update-baseline"]) == 0
+    assert load_results(baseline).keys() == {"buffer.get.threads-1", "other.case"}
+
+    save_results(baseline, {"buffer.get.threads-1": 1e-12})
+    assert main(args) == 1
+
+
+def test_iter_cases_sets_up_lazily():
+    """
+    Verify that listing and filtering cases creates no fixtures or variables.
+    """
+    environ = os.environ.copy()
+    names = [case.name for case in iter_cases(max_threads=6)]
+
+    assert [name for name in names if name.startswith("buffer.get.")] == [
+        "buffer.get.threads-1",
+        "buffer.get.threads-2",
+        "buffer.get.threads-4",
+        "buffer.get.threads-6",
+    ]
+
+    results = run_benchmarks(iter_cases(), pattern="env_loader.load.int", repeat=2, scale=0.01)
+
+    assert results.keys() == {"env_loader.load.int"}
+    assert os.environ == environ
+    assert not {"__bench__", "__bench_insert__"} & Buffer().stats().keys()
+
+
+def test_cli_rejects_invalid_counts():
+    """
+    Verify that non-positive repeat and thread counts are usage errors.
+    """
+    for args in (["--repeat", "0"], ["--threads", "0"]):
+        with pytest.raises(SystemExit):
+            parse_args(args)
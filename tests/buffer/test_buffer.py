@@ -0,0 +1,498 @@
+import random
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ten_utils import Singleton, FailedLoadBufferFile, FailedSerializeBufferRecord
+from ten_utils.buffer import Buffer, JsonSerializer, PickleSerializer
+from ten_utils.buffer._periodic import PeriodicTask
+from ten_utils.buffer._persistence import write_snapshot
+
+
+@pytest.fixture(autouse=True)
+def reset_buffer_singleton():
+    Singleton.clear_instances()
+    yield
+    Buffer().close_write_log()
+    Buffer().stop_snapshots()
+    Buffer().stop_stats_report()
+
+
+@pytest.fixture
+def buffer() -> Buffer:
+    """
+    Fixture that returns a fresh `Buffer` instance.
+    """
+    return Buffer()
+
+
+def test_set_get_clear(buffer):
+    """
+    Verify the basic key-value operations.
+    """
+    buffer.set("user", "Alice")
+    assert buffer.get("user") == "Alice"
+
+    buffer.clear()
+    assert buffer.get("user") is None
+
+
+@pytest.mark.parametrize("serializer", [None, JsonSerializer])
+def test_save_and_load_snapshot(buffer, tmp_path, serializer):
+    """
+    Verify that a snapshot restores every entry into an empty buffer.
+    """
+    kwargs = {"serializer": serializer} if serializer else {}
+    path = tmp_path / "buffer.snapshot"
+
+    buffer.set("user", "Alice")
+    buffer.set("settings", {"theme": "dark"})
+    buffer.save(path, **kwargs)
+
+    buffer.clear()
+    assert buffer.load(path, **kwargs) == 2
+    assert buffer.get("user") == "Alice"
+    assert buffer.get("settings") == {"theme": "dark"}
+    assert not list(tmp_path.glob("*.tmp")), "temporary file should be renamed"
+
+
+def test_load_missing_file_is_noop(buffer, tmp_path):
+    """
+    Verify that loading a non-existent file leaves the buffer untouched.
+    """
+    assert buffer.load(tmp_path / "missing.snapshot") == 0
+
+
+def test_load_invalid_file_raises(buffer, tmp_path):
+    """
+    Verify that a file without the buffer header is rejected.
+    """
+    path = tmp_path / "garbage.snapshot"
+    path.write_bytes(b"not a buffer file")
+
+    with pytest.raises(FailedLoadBufferFile):
+        buffer.load(path)
+
+
+def test_write_log_replay(buffer, tmp_path):
+    """
+    Verify that the write log replays sets and clears in order.
+    """
+    path = tmp_path / "buffer.log"
+
+    buffer.open_write_log(path)
+    buffer.set("a", 1)
+    buffer.clear()
+    buffer.set("b", 2)
+    buffer.close_write_log()
+
+    buffer.clear()
+    buffer.set("a", "stale")
+    assert buffer.load(path) == 3
+    assert buffer.get("a") is None
+    assert buffer.get("b") == 2
+
+
+def test_write_log_ignores_truncated_tail(buffer, tmp_path):
+    """
+    Verify that a partially written last record is skipped.
+    """
+    path = tmp_path / "buffer.log"
+
+    buffer.open_write_log(path)
+    buffer.set("a", 1)
+    buffer.close_write_log()
+
+    with open(path, "ab") as file:
+        file.write(b"\x00\x00\x01\x00partial")
+
+    buffer.clear()
+    assert buffer.load(path) == 1
+    assert buffer.get("a") == 1
+
+
+def test_write_log_reopen_after_truncated_tail(buffer, tmp_path):
+    """
+    Verify that records appended after a crash are not swallowed by a torn record.
+    """
+    path = tmp_path / "buffer.log"
+
+    buffer.open_write_log(path)
+    buffer.set("a", 1)
+    buffer.close_write_log()
+
+    with open(path, "ab") as file:
+        file.write(b"\x00\x00\x01\x00partial")
+
+    buffer.open_write_log(path)
+    buffer.set("b", 2)
+    buffer.set("c", 3)
+    buffer.close_write_log()
+
+    buffer.clear()
+    assert buffer.load(path) == 3
+    assert buffer.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": 3}
+
+
+def test_write_log_rejects_foreign_file(buffer, tmp_path):
+    """
+    Verify that an existing file without the buffer header is not appended to.
+    """
+    path = tmp_path / "buffer.log"
+    path.write_bytes(b"not a buffer file")
+
+    with pytest.raises(FailedLoadBufferFile):
+        buffer.open_write_log(path)
+
+    assert path.read_bytes() == b"not a buffer file"
+
+
+def test_save_rotates_write_log(buffer, tmp_path):
+    """
+    Verify that saving a snapshot compacts the open write log.
+    """
+    log_path = tmp_path / "buffer.log"
+    snapshot_path = tmp_path / "buffer.snapshot"
+
+    buffer.open_write_log(log_path)
+    buffer.set("a", 1)
+    buffer.save(snapshot_path)
+    buffer.set("b", 2)
+    buffer.close_write_log()
+
+    buffer.clear()
+    assert buffer.load(snapshot_path) == 1
+    assert buffer.load(log_path) == 1
+    assert buffer.get("a") == 1
+    assert buffer.get("b") == 2
+    assert not list(tmp_path.glob("buffer.log.rotated.*"))
+
+
+def test_failed_save_keeps_rotated_records(buffer, tmp_path):
+    """
+    Verify that records rotated by a failed snapshot are still replayed.
+    """
+    log_path = tmp_path / "buffer.log"
+    snapshot_path = tmp_path / "buffer.snapshot"
+
+    buffer.open_write_log(log_path)
+    buffer.set("a", 1)
+
+    with patch("ten_utils.buffer.buffer.write_snapshot", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            buffer.save(snapshot_path)
+
+    assert [path.name for path in tmp_path.glob("buffer.log.rotated.*")] == ["buffer.log.rotated.1"]
+    assert buffer.load(log_path) == 1
+
+    buffer.set("b", 2)
+    buffer.save(snapshot_path)
+    assert not list(tmp_path.glob("buffer.log.rotated.*"))
+
+    buffer.set("c", 3)
+    buffer.close_write_log()
+
+    buffer.clear()
+    buffer.load(log_path)
+    assert buffer.get_many(["a", "b", "c"]) == {"c": 3}
+
+    buffer.load(snapshot_path)
+    assert buffer.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": 3}
+
+
+def test_failed_rotation_keeps_write_log_usable(buffer, tmp_path):
+    """
+    Verify that a failing rotation leaves the write log open and intact.
+    """
+    log_path = tmp_path / "buffer.log"
+
+    buffer.open_write_log(log_path)
+    buffer.set("a", 1)
+
+    with patch("ten_utils.buffer._persistence.os.replace", side_effect=OSError("busy")):
+        with pytest.raises(OSError):
+            buffer.save(tmp_path / "buffer.snapshot")
+
+    buffer.set("b", 2)
+    buffer.close_write_log()
+
+    buffer.clear()
+    assert buffer.load(log_path) == 2
+    assert buffer.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+
+def test_unserializable_value_is_not_stored(buffer, tmp_path):
+    """
+    Verify that a value the write log serializer rejects never reaches memory.
+    """
+    log_path = tmp_path / "buffer.log"
+    sessions = buffer.namespace("sessions")
+
+    buffer.open_write_log(log_path, serializer=JsonSerializer)
+    buffer.set("a", 1)
+
+    with pytest.raises(FailedSerializeBufferRecord):
+        buffer.set("a", {1, 2})
+
+    with pytest.raises(FailedSerializeBufferRecord):
+        sessions.set_many({"b": {3}})
+
+    buffer.close_write_log()
+
+    assert buffer.get("a") == 1
+    assert "b" not in sessions
+
+    buffer.clear()
+    buffer.load(log_path, serializer=JsonSerializer)
+    assert buffer.get("a") == 1
+
+
+def test_periodic_snapshots(buffer, tmp_path):
+    """
+    Verify that periodic snapshots are written in the background.
+    """
+    path = tmp_path / "buffer.snapshot"
+
+    buffer.set("a", 1)
+    buffer.start_snapshots(path, interval=0.01)
+
+    deadline = time.monotonic() + 2
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    buffer.stop_snapshots()
+    assert path.exists()
+
+    with pytest.raises(ValueError):
+        buffer.start_snapshots(path, interval=0)
+
+
+def test_namespaces_are_independent(buffer):
+    """
+    Verify that namespaces do not share keys and are cleared separately.
+    """
+    sessions = buffer.namespace("sessions")
+    users = buffer.namespace("users")
+
+    assert buffer.namespace("sessions") is sessions
+
+    sessions.set("id", "s-1")
+    users.set("id", "u-1")
+    buffer.set("id", "default")
+
+    sessions.clear()
+    assert sessions.get("id") is None
+    assert users.get("id") == "u-1"
+    assert buffer.get("id") == "default"
+
+    buffer.clear()
+    assert len(users) == 0
+    assert buffer.get("id") is None
+
+
+def test_bulk_operations(buffer):
+    """
+    Verify `get_many`, `set_many` and `delete_many`.
+    """
+    buffer.set_many({"a": 1, "b": None, "c": 3})
+
+    assert buffer.get_many(["a", "b", "missing"]) == {"a": 1, "b": None}
+    assert buffer.delete_many(["a", "c", "missing"]) == 2
+    assert buffer.get_many(["a", "b", "c"]) == {"b": None}
+    assert buffer.delete("b") is True
+    assert buffer.delete("b") is False
+
+
+def test_prefix_and_range_scans(buffer):
+    """
+    Verify that scans return matching entries ordered by key.
+    """
+    namespace = buffer.namespace("scan")
+    namespace.set_many({"user:2": 2, "user:1": 1, "order:1": "o"})
+    namespace.set("user:10", 10)
+    namespace.set("users", "not a user key")
+    namespace.delete("user:2")
+
+    assert namespace.scan_prefix("user:") == [("user:1", 1), ("user:10", 10)]
+    assert namespace.scan_prefix("nothing") == []
+    assert namespace.scan_range("order:", "user:10") == [("order:1", "o"), ("user:1", 1)]
+    assert [key for key, _ in namespace.scan_range()] == ["order:1", "user:1", "user:10", "users"]
+
+
+def test_scans_follow_interleaved_updates(buffer):
+    """
+    Verify that the lazily maintained key index matches the namespace contents.
+    """
+    namespace = buffer.namespace("index")
+    rng = random.Random(0)
+    expected = {}
+
+    for step in range(2_000):
+        key = f"k{rng.randrange(200):03d}"
+        action = rng.random()
+
+        if action < 0.5:
+            namespace.set(key, step)
+            expected[key] = step
+
+        elif action < 0.7:
+            namespace.delete(key)
+            expected.pop(key, None)
+
+        elif action < 0.75:
+            namespace.set_many({key: step, f"{key}x": step})
+            expected.update({key: step, f"{key}x": step})
+
+        elif action < 0.76:
+            namespace.clear()
+            expected.clear()
+
+        else:
+            assert namespace.scan_range() == sorted(expected.items())
+            assert namespace.scan_prefix("k1") == sorted(
+                item for item in expected.items() if item[0].startswith("k1")
+            )
+
+
+def test_scan_patches_index_in_place(buffer):
+    """
+    Verify that a few writes between scans patch the key index instead of rebuilding it.
+    """
+    namespace = buffer.namespace("index")
+    namespace.set_many({f"k{index:04d}": index for index in range(1_000)})
+    namespace.scan_prefix("k")
+    index = namespace._keys
+
+    namespace.delete("k0500")
+    assert namespace.scan_prefix("k050") == [(f"k050{digit}", 500 + digit) for digit in range(1, 10)]
+    assert namespace._keys is index
+
+    namespace.set("k0500", 500)
+    namespace.set("k0500a", "new")
+    assert namespace.scan_prefix("k0500") == [("k0500", 500), ("k0500a", "new")]
+    assert namespace._keys is index
+    assert len(index) == 1_001
+
+
+def test_load_rejects_unexpected_record(buffer, tmp_path):
+    """
+    Verify that a record with an unexpected shape raises the library error.
+    """
+    path = tmp_path / "buffer.snapshot"
+    write_snapshot(path, [("set", "only-a-key")], PickleSerializer)
+
+    with pytest.raises(FailedLoadBufferFile):
+        buffer.load(path)
+
+
+def test_namespaces_persistence(buffer, tmp_path):
+    """
+    Verify that snapshots and write logs keep namespaces apart.
+    """
+    log_path = tmp_path / "buffer.log"
+    snapshot_path = tmp_path / "buffer.snapshot"
+    sessions = buffer.namespace("sessions")
+
+    sessions.set("a", 1)
+    buffer.set("a", "default")
+    buffer.save(snapshot_path)
+
+    buffer.open_write_log(log_path)
+    sessions.set_many({"b": 2, "c": 3})
+    sessions.delete_many(["a", "c"])
+    buffer.close_write_log()
+
+    buffer.clear()
+    buffer.load(snapshot_path)
+    buffer.load(log_path)
+
+    assert sessions.scan_range() == [("b", 2)]
+    assert buffer.get("a") == "default"
+
+
+def test_stats_disabled_by_default(buffer):
+    """
+    Verify that nothing is counted until statistics are enabled.
+    """
+    buffer.set("a", 1)
+    buffer.get("a")
+
+    stats = buffer.stats()[""]
+    assert (stats.hits, stats.misses, stats.sets) == (0, 0, 0)
+    assert stats.entries == 1
+    assert stats.memory is None
+
+
+def test_stats_counters(buffer):
+    """
+    Verify hit, miss, set and eviction accounting per namespace.
+    """
+    buffer.enable_stats()
+    sessions = buffer.namespace("sessions")
+
+    buffer.set("none", None)
+    assert buffer.get("none", default="missing") is None
+    assert buffer.get("other", default="missing") == "missing"
+
+    sessions.set_many({"a": 1, "b": 2, "c": 3})
+    sessions.get_many(["a", "b", "x"])
+    sessions.delete("a")
+    sessions.clear()
+
+    stats = buffer.stats(memory=True)
+    assert (stats[""].hits, stats[""].misses, stats[""].sets) == (1, 1, 1)
+    assert stats[""].hit_ratio == 0.5
+    assert (stats["sessions"].hits, stats["sessions"].misses) == (2, 1)
+    assert stats["sessions"].sets == 3
+    assert stats["sessions"].evictions == 3
+    assert stats["sessions"].entries == 0
+    assert stats[""].memory > 0
+
+    sessions.set_many({f"key:{index}": f"{index:<1024}" for index in range(1_000)})
+    memory = buffer.stats(memory=True)
+    assert memory["sessions"].memory > 1024 * 1_000
+    assert memory["sessions"].memory > memory[""].memory
+
+    buffer.disable_stats()
+    assert buffer.stats()[""].hits == 0
+
+
+def test_stats_report(buffer):
+    """
+    Verify that the periodic report goes through the given logger.
+    """
+    logger = MagicMock()
+    buffer.set("a", 1)
+    buffer.start_stats_report(interval=0.01, logger=logger)
+
+    deadline = time.monotonic() + 2
+    while not logger.info.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    buffer.stop_stats_report()
+    assert "entries=1" in logger.info.call_args[0][0]
+
+
+def test_periodic_task_survives_failures():
+    """
+    Verify that an exception in a periodic run is logged and the task keeps running.
+    """
+    calls = []
+
+    def flaky():
+        calls.append(None)
+        if len(calls) == 1:
+            raise OSError("disk full")
+
+    with patch("ten_utils.buffer._periodic.Logger.error") as mock_error:
+        task = PeriodicTask(function=flaky, interval=0.01, name="Flaky")
+
+        deadline = time.monotonic() + 2
+        while len(calls) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        task.stop()
+
+    assert len(calls) >= 3
+    assert "disk full" in mock_error.call_args[0][0]
@@ -0,0 +1,126 @@
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from ten_utils import (
+    Singleton,
+    Multiton,
+    UnhashableMultitonArguments,
+    MultitonWeakReferencesUnsupported,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    Singleton.clear_instances()
+    Multiton.clear_instances()
+
+
+def test_singleton_returns_same_instance():
+    """
+    Verify that a Singleton class is constructed only once.
+    """
+    class Config(metaclass=Singleton):
+        def __init__(self, value=None):
+            self.value = value
+
+    assert Config(1) is Config(2)
+    assert Config().value == 1
+
+
+def test_singleton_concurrent_construction():
+    """
+    Verify that concurrent first calls construct the instance only once.
+    """
+    constructed = []
+
+    class SlowConsole(metaclass=Singleton):
+        def __init__(self):
+            time.sleep(0.05)
+            constructed.append(self)
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(SlowConsole())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(constructed) == 1
+    assert all(result is constructed[0] for result in results)
+
+
+def test_multiton_keyed_by_arguments():
+    """
+    Verify that a Multiton class caches one instance per set of arguments.
+    """
+    class Pool(metaclass=Multiton):
+        def __init__(self, url, size=1):
+            self.url = url
+            self.size = size
+
+    assert Pool("db-a") is Pool("db-a")
+    assert Pool("db-a") is not Pool("db-b")
+    assert Pool("db-a", size=2) is Pool("db-a", size=2)
+    assert Pool("db-a", size=2) is not Pool("db-a")
+
+    with pytest.raises(UnhashableMultitonArguments):
+        Pool(["db-a"])
+
+
+def test_multiton_weak_instances_are_collected():
+    """
+    Verify that weak Multiton instances are dropped once unreferenced.
+    """
+    class Connection(metaclass=Multiton, weak=True):
+        def __init__(self, url):
+            self.url = url
+
+    first = Connection("db")
+    assert Connection("db") is first
+
+    del first
+    gc.collect()
+
+    assert len(Multiton._instances[Connection]) == 0
+    assert Connection("db").url == "db"
+
+
+def test_multiton_weak_requires_weakref_support():
+    """
+    Verify that weak=True is rejected at class creation for slotted classes.
+    """
+    with pytest.raises(MultitonWeakReferencesUnsupported):
+        class Slotted(metaclass=Multiton, weak=True):
+            __slots__ = ("url",)
+
+    class SlottedWithWeakref(metaclass=Multiton, weak=True):
+        __slots__ = ("url", "__weakref__")
+
+    assert SlottedWithWeakref() is SlottedWithWeakref()
+
+
+def test_multiton_subclass_inherits_weak():
+    """
+    Verify that subclasses keep the weak setting unless they override it.
+    """
+    class Base(metaclass=Multiton, weak=True):
+        pass
+
+    class Child(Base):
+        pass
+
+    class StrongChild(Base, weak=False):
+        pass
+
+    assert isinstance(Multiton._instances[Child], weakref.WeakValueDictionary)
+    assert isinstance(Multiton._instances[StrongChild], dict)